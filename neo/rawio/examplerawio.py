@@ -362,9 +362,9 @@ class ExampleRawIO(BaseRawIO):
                                         spike_channel_index, t_start, t_stop)
         nb_spike = ts.size
 
-        np.random.seed(2205)  # a magic number (my birthday)
-        waveforms = np.random.randint(low=-2**4, high=2**4, size=nb_spike * 50, dtype='int16')
-        waveforms = waveforms.reshape(nb_spike, 1, 50)
+        # use a local generator, seeding the global numpy random state would affect other code
+        rng = np.random.default_rng(2205)  # a magic number (my birthday)
+        waveforms = rng.integers(low=-2**4, high=2**4, size=(nb_spike, 1, 50), dtype='int16')
         return waveforms
 
     def _event_count(self, block_index, seg_index, event_channel_index):
@@ -13,6 +13,10 @@ in future versions by exploiting the block-wise loading of signals.
 
 To clear the currently cached signal data use the `clear_analogsignal_cache()` method.
 
+By default the annotations (`raw_annotations`) are only generated on first access, such that
+parsing the header is fast when only raw data chunks are needed. Use `lazy_annotations=False`
+to generate them together with the header.
+
 Note on Neo header and spike channels:
 The IO only considers enabled channels and will not list disabled channels in its header.
 
@@ -21,11 +25,14 @@ a PL2 spike channel will be represented as an individual neo spike channel.
 
 Author: Julia Sprenger
 """
+import functools
+import logging
 import pathlib
 import warnings
 from collections import namedtuple
 from urllib.request import urlopen
 from datetime import datetime
+from pprint import pformat
 
 import numpy as np
 
@@ -56,7 +63,10 @@ class Plexon2RawIO(BaseRawIO):
     extensions = ['pl2']
     rawmode = 'one-file'
 
-    def __init__(self, filename, pl2_dll_file_path=None):
+    # converted PL2FileInfo annotations, shared by all instances and keyed by (filename, mtime)
+    _block_info_cache = {}
+
+    def __init__(self, filename, pl2_dll_file_path=None, lazy_annotations=True):
 
         # signals, event and spiking data will be cached
         # cached signal data can be cleared using `clear_analogsignal_cache()()`
@@ -64,6 +74,10 @@ class Plexon2RawIO(BaseRawIO):
         self._event_channel_cache = {}
         self._spike_channel_cache = {}
 
+        # annotations can be generated on first access instead of when parsing the header
+        self.lazy_annotations = lazy_annotations
+        self._raw_annotations = None
+
         # note that this filename is used in self._source_name
         self.filename = pathlib.Path(filename)
 
@@ -90,7 +104,7 @@ class Plexon2RawIO(BaseRawIO):
         from neo.rawio.plexon2rawio.pypl2.pypl2lib import PyPL2FileReader
         self.pl2reader = PyPL2FileReader(pl2_dll_file_path=pl2_dll_file_path)
 
-        # Open the file.
+        # Open the file once, this handle is used for all further access.
         self.pl2reader.pl2_open_file(self.filename)
 
     def _source_name(self):
@@ -101,12 +115,22 @@ class Plexon2RawIO(BaseRawIO):
         Collect information about the file, construct neo header and provide annotations
         """
 
+        # Channel infos are requested from the dll only once here and reused for the annotations,
+        # each request being a comparatively expensive ctypes call.
+        analog_channel_infos = {}
+        spike_channel_infos = {}
+        digital_channel_infos = {}
+
         # Scanning sources and populating signal channels at the same time. Sources have to have
         # same sampling rate and number of samples to belong to one stream.
-        signal_channels = []
+        n_analog_channels = self.pl2reader.pl2_file_info.m_TotalNumberOfAnalogChannels
+        signal_channels = np.empty(n_analog_channels, dtype=_signal_channel_dtype)
+        n_signal_channels = 0
         source_characteristics = {}
+        # units are usually shared by all channels, decode each distinct value only once
+        decoded_units = {}
         Source = namedtuple('Source', 'id name sampling_rate n_samples')
-        for c in range(self.pl2reader.pl2_file_info.m_TotalNumberOfAnalogChannels):
+        for c in range(n_analog_channels):
             achannel_info = self.pl2reader.pl2_get_analog_channel_info(c)
 
             # only consider active channels
@@ -125,26 +149,46 @@ class Plexon2RawIO(BaseRawIO):
             assert channel_source == existing_source
 
             ch_name = achannel_info.m_Name.decode()
+            analog_channel_infos[ch_name] = achannel_info
+
             chan_id = f'source{achannel_info.m_Source}.{achannel_info.m_Channel}'
             dtype = 'int16'
-            units = achannel_info.m_Units.decode()
+            raw_units = achannel_info.m_Units
+            if raw_units not in decoded_units:
+                decoded_units[raw_units] = raw_units.decode()
+            units = decoded_units[raw_units]
             gain = achannel_info.m_CoeffToConvertToUnits
             offset = 0.  # PL2 files don't contain information on signal offset
             stream_id = source_id
-            signal_channels.append((ch_name, chan_id, rate, dtype, units, gain, offset, stream_id))
 
-        signal_channels = np.array(signal_channels, dtype=_signal_channel_dtype)
+            # fill preallocated header array instead of converting a list of tuples afterwards,
+            # a complete row is written at once
+            signal_channels[n_signal_channels] = (ch_name, chan_id, rate, dtype, units, gain,
+                                                  offset, stream_id)
+            n_signal_channels += 1
+
+        signal_channels = signal_channels[:n_signal_channels]
         self.signal_stream_characteristics = source_characteristics
+        # stream characteristics in stream order for index-based lookups
+        self._stream_characteristics = list(source_characteristics.values())
 
         # create signal streams from source information
         signal_streams = []
-        for stream_idx, source in source_characteristics.items():
+        for source in self._stream_characteristics:
             signal_streams.append((source.name, str(source.id)))
         signal_streams = np.array(signal_streams, dtype=_signal_stream_dtype)
 
+        # names of the channels of each stream, used to access the signal data per stream index
+        self._stream_channel_names = [
+            signal_channels['name'][signal_channels['stream_id'] == stream_id]
+            for stream_id in signal_streams['id']
+        ]
+        # chunk readers specialized to each stream, see `_build_stream_reader`
+        self._stream_readers = [self._build_stream_reader(stream_index)
+                                for stream_index in range(len(signal_streams))]
+
         # pre-loading spike channel_data for later usage
         self._spike_channel_cache = {}
-        spike_channels = []
         for c in range(self.pl2reader.pl2_file_info.m_TotalNumberOfSpikeChannels):
             schannel_info = self.pl2reader.pl2_get_spike_channel_info(c)
 
@@ -152,23 +196,34 @@ class Plexon2RawIO(BaseRawIO):
             if not schannel_info.m_ChannelEnabled:
                 continue
 
-            for channel_unit_id in range(schannel_info.m_NumberOfUnits):
-                unit_name = f'{schannel_info.m_Name.decode()}.{channel_unit_id}'
-                unit_id = f'unit{schannel_info.m_Channel}.{channel_unit_id}'
-                wf_units = schannel_info.m_Units
-                wf_gain = schannel_info.m_CoeffToConvertToUnits
-                wf_offset = 0.  # A waveform offset is not provided in PL2 files
-                wf_left_sweep = schannel_info.m_PreThresholdSamples
-                wf_sampling_rate = schannel_info.m_SamplesPerSecond
-                spike_channels.append((unit_name, unit_id, wf_units, wf_gain,
-                                      wf_offset, wf_left_sweep, wf_sampling_rate))
+            spike_channel_infos[schannel_info.m_Name.decode()] = schannel_info
+
+        # each unit of a PL2 spike channel is represented as an individual neo spike channel
+        n_units = sum(info.m_NumberOfUnits for info in spike_channel_infos.values())
+        spike_channels = np.empty(n_units, dtype=_spike_channel_dtype)
+        n_spike_channels = 0
+        for schannel_name, schannel_info in spike_channel_infos.items():
+            n_channel_units = schannel_info.m_NumberOfUnits
+            channel_units = spike_channels[n_spike_channels: n_spike_channels + n_channel_units]
+
+            # waveform properties are shared by all units of a channel
+            channel_units['wf_units'] = schannel_info.m_Units
+            channel_units['wf_gain'] = schannel_info.m_CoeffToConvertToUnits
+            channel_units['wf_offset'] = 0.  # A waveform offset is not provided in PL2 files
+            channel_units['wf_left_sweep'] = schannel_info.m_PreThresholdSamples
+            channel_units['wf_sampling_rate'] = schannel_info.m_SamplesPerSecond
 
-        spike_channels = np.array(spike_channels, dtype=_spike_channel_dtype)
+            channel_units['name'] = [f'{schannel_name}.{unit_id}' for unit_id in range(n_channel_units)]
+            channel_units['id'] = [f'unit{schannel_info.m_Channel}.{unit_id}'
+                                   for unit_id in range(n_channel_units)]
+            n_spike_channels += n_channel_units
 
         # creating event/epoch channel
         self._event_channel_cache = {}
-        event_channels = []
-        for i in range(self.pl2reader.pl2_file_info.m_NumberOfDigitalChannels):
+        n_digital_channels = self.pl2reader.pl2_file_info.m_NumberOfDigitalChannels
+        event_channels = np.empty(n_digital_channels, dtype=_event_channel_dtype)
+        n_event_channels = 0
+        for i in range(n_digital_channels):
             echannel_info = self.pl2reader.pl2_get_digital_channel_info(i)
 
             # only consider active channels
@@ -177,9 +232,22 @@ class Plexon2RawIO(BaseRawIO):
 
             # event channels are characterized by (name, id, type), with type in ['event', 'epoch']
             channel_name = echannel_info.m_Name.decode()
-            event_channels.append((channel_name, echannel_info.m_Channel, 'event'))
-
-        event_channels = np.array(event_channels, dtype=_event_channel_dtype)
+            digital_channel_infos[channel_name] = echannel_info
+            event_channels[n_event_channels] = (channel_name, echannel_info.m_Channel, 'event')
+            n_event_channels += 1
+
+        event_channels = event_channels[:n_event_channels]
+        # channel infos are kept for the annotations, digital channel infos also provide the
+        # number of events without loading the event data
+        self._digital_channel_infos = digital_channel_infos
+        self._analog_channel_infos = analog_channel_infos
+        self._spike_channel_infos = spike_channel_infos
+
+        # segment limits in seconds, precomputed as they are requested for every data access
+        file_info = self.pl2reader.pl2_file_info
+        self._seg_t_start = file_info.m_StartRecordingTime / file_info.m_TimestampFrequency
+        end_time = file_info.m_StartRecordingTime + file_info.m_DurationOfRecording
+        self._seg_t_stop = end_time / file_info.m_TimestampFrequency
 
         # fill into header dict
         self.header = {}
@@ -190,12 +258,26 @@ class Plexon2RawIO(BaseRawIO):
         self.header['spike_channels'] = spike_channels
         self.header['event_channels'] = event_channels
 
-        self._generate_minimal_annotations()
+        # annotations are only generated on first access of `raw_annotations` if lazy
+        self._raw_annotations = None
+        if not self.lazy_annotations:
+            self._generate_annotations()
 
-        # this pprint lines really help for understand the nested (and complicated sometimes) dict
-        # from pprint import pprint
-        # pprint(self.raw_annotations)
+    @property
+    def raw_annotations(self):
+        if self._raw_annotations is None and self.header is not None:
+            self._generate_annotations()
+        return self._raw_annotations
 
+    @raw_annotations.setter
+    def raw_annotations(self, raw_annotations):
+        self._raw_annotations = raw_annotations
+
+    def _generate_annotations(self):
+        """
+        Generate the neo annotations from the PL2 file and channel infos collected in _parse_header
+        """
+        self._generate_minimal_annotations()
 
         # Note: pl2_file_info.m_ReprocessorDateTime seems to be always empty.
         # To be checked against alternative pl2 reader.
@@ -205,26 +287,7 @@ class Plexon2RawIO(BaseRawIO):
         bl_ann = self.raw_annotations['blocks'][block_index]
         bl_ann['name'] = 'Block containing PL2 data#{}'.format(block_index)
         bl_ann['file_origin'] = self.filename
-        file_info = self.pl2reader.pl2_file_info
-        block_info = {attr: getattr(file_info, attr) for attr, _ in file_info._fields_}
-
-        # convert ctypes datetime objects to datetime.datetime objects for annotations
-        from .pypl2.pypl2lib import tm
-        for anno_key, anno_value in block_info.items():
-            if isinstance(anno_value, tm):
-                tmo = anno_value
-                # invalid datetime information if year is <1
-                if tmo.tm_year != 0:
-                    microseconds = block_info['m_CreatorDateTimeMilliseconds'] * 1000
-                    dt = datetime(year=tmo.tm_year, month=tmo.tm_mon, day=tmo.tm_mday, hour=tmo.tm_hour,
-                                  minute=tmo.tm_min, second=tmo.tm_sec, microsecond=microseconds)
-                    # ignoring daylight saving time information for now as timezone is unknown
-
-                else:
-                    dt = None
-
-                block_info[anno_key] = dt
-
+        block_info = self._get_block_info()
         bl_ann.update(block_info)
         for seg_index in range(1):
             seg_ann = bl_ann['segments'][seg_index]
@@ -236,7 +299,7 @@ class Plexon2RawIO(BaseRawIO):
                                'm_Source', 'm_Channel']
             for spike_channel_idx, spike_header in enumerate(self.header['spike_channels']):
                 schannel_name = spike_header['name'].split('.')[0]
-                schannel_info = self.pl2reader.pl2_get_spike_channel_info_by_name(schannel_name)
+                schannel_info = self._spike_channel_infos[schannel_name]
 
                 spiketrain_an = seg_ann['spikes'][spike_channel_idx]
                 for key in spike_annotation_keys:
@@ -246,7 +309,7 @@ class Plexon2RawIO(BaseRawIO):
             event_annotation_keys = ['m_Source', 'm_Channel', 'm_Name']
             for event_channel_idx, event_header in enumerate(self.header['event_channels']):
                 dchannel_name = event_header['name']
-                dchannel_info = self.pl2reader.pl2_get_digital_channel_info_by_name(dchannel_name)
+                dchannel_info = self._digital_channel_infos[dchannel_name]
 
                 event_an = seg_ann['events'][event_channel_idx]
                 for key in event_annotation_keys:
@@ -265,28 +328,64 @@ class Plexon2RawIO(BaseRawIO):
                 stream_channel_mask = self.header['signal_channels']['stream_id'] == stream_id
                 for signal_idx, signal_header in enumerate(self.header['signal_channels'][stream_channel_mask]):
                     achannel_name = signal_header['name']
-                    achannel_info = self.pl2reader.pl2_get_analog_channel_info_by_name(achannel_name)
+                    achannel_info = self._analog_channel_infos[achannel_name]
                     for key in signal_array_annotation_keys:
                         signal_array_annotations[key].append(getattr(achannel_info, key))
 
                 seg_ann['signals'][stream_idx]['__array_annotations__'] = signal_array_annotations
 
+        # formatting the nested annotation dict is costly, only do it when it is actually logged
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(pformat(self.raw_annotations))
+
+    def _get_block_info(self):
+        """
+        Convert the PL2FileInfo structure into a dict of block annotations.
+
+        The result is cached on the class, so re-parsing the header of an unmodified file
+        does not go through the ctypes structure again.
+        """
+        cache_key = (str(self.filename.absolute()), self.filename.stat().st_mtime_ns)
+        if cache_key in self._block_info_cache:
+            return self._block_info_cache[cache_key]
+
+        file_info = self.pl2reader.pl2_file_info
+        block_info = {attr: getattr(file_info, attr) for attr, _ in type(file_info)._fields_}
+
+        # convert ctypes datetime objects to datetime.datetime objects for annotations
+        from .pypl2.pypl2lib import tm
+        for anno_key, anno_value in block_info.items():
+            if isinstance(anno_value, tm):
+                tmo = anno_value
+                # invalid datetime information if year is <1
+                if tmo.tm_year != 0:
+                    microseconds = block_info['m_CreatorDateTimeMilliseconds'] * 1000
+                    dt = datetime(year=tmo.tm_year, month=tmo.tm_mon, day=tmo.tm_mday, hour=tmo.tm_hour,
+                                  minute=tmo.tm_min, second=tmo.tm_sec, microsecond=microseconds)
+                    # ignoring daylight saving time information for now as timezone is unknown
+
+                else:
+                    dt = None
+
+                block_info[anno_key] = dt
+
+        self._block_info_cache[cache_key] = block_info
+        return block_info
 
     def _segment_t_start(self, block_index, seg_index):
         # this must return a float values in seconds
-        return self.pl2reader.pl2_file_info.m_StartRecordingTime / self.pl2reader.pl2_file_info.m_TimestampFrequency
+        return self._seg_t_start
 
     def _segment_t_stop(self, block_index, seg_index):
         # this must return a float value in seconds
-        end_time = self.pl2reader.pl2_file_info.m_StartRecordingTime + self.pl2reader.pl2_file_info.m_DurationOfRecording
-        return end_time / self.pl2reader.pl2_file_info.m_TimestampFrequency
+        return self._seg_t_stop
 
 
     def _get_signal_size(self, block_index, seg_index, stream_index):
         # this must return an integer value (the number of samples)
 
         stream_id = self.header['signal_streams'][stream_index]['id']
-        stream_characteristic = list(self.signal_stream_characteristics.values())[stream_index]
+        stream_characteristic = self._stream_characteristics[stream_index]
         assert stream_id == stream_characteristic.id
         return stream_characteristic.n_samples
 
@@ -307,12 +406,22 @@ class Plexon2RawIO(BaseRawIO):
         # To speed up this call all preparatory calculations should be implemented
         # in _parse_header().
 
-        stream_id = self.header['signal_streams'][stream_index]['id']
-        mask = self.header['signal_channels']['stream_id'] == stream_id
-        stream_channels = self.header['signal_channels'][mask]
+        return self._stream_readers[stream_index](i_start, i_stop, channel_indexes)
+
+    def _build_stream_reader(self, stream_index):
+        """
+        Create a chunk reader for a stream, with the channel names and number of samples of the
+        stream bound in advance
+        """
+        stream_channel_names = self._stream_channel_names[stream_index]
+        n_samples = self._stream_characteristics[stream_index].n_samples
+        all_channel_indexes = np.arange(len(stream_channel_names), dtype='int')
+        return functools.partial(self._read_stream_chunk, stream_channel_names, n_samples,
+                                 all_channel_indexes)
 
-        n_channels = len(stream_channels)
-        n_samples = self.get_signal_size(block_index, seg_index, stream_index)
+    def _read_stream_chunk(self, stream_channel_names, n_samples, all_channel_indexes,
+                           i_start, i_stop, channel_indexes):
+        n_channels = len(stream_channel_names)
 
         if i_start is None:
             i_start = 0
@@ -324,21 +433,22 @@ class Plexon2RawIO(BaseRawIO):
 
         # converting channel_indexes to array representation
         if channel_indexes is None:
-            channel_indexes = np.arange(len(stream_channels), dtype='int')
+            channel_indexes = all_channel_indexes
         elif isinstance(channel_indexes, slice):
-            channel_indexes = np.arange(len(stream_channels), dtype='int')[channel_indexes]
+            channel_indexes = np.arange(*channel_indexes.indices(n_channels), dtype='int')
         else:
             channel_indexes = np.asarray(channel_indexes)
 
-        # channel index sanity check
-        if any(channel_indexes < 0) or any(channel_indexes >= n_channels):
+        # channel index sanity check, using reductions instead of intermediate boolean arrays
+        if channel_indexes.size and (channel_indexes.min() < 0 or channel_indexes.max() >= n_channels):
             raise IndexError(f'Channel index out of range {channel_indexes} for stream with {n_channels} channels')
 
         nb_chan = len(channel_indexes)
 
-        raw_signals = np.empty((i_stop - i_start, nb_chan), dtype='int16')
+        # PL2 data is loaded per channel, so fill a channel-major buffer with contiguous rows
+        raw_signals = np.empty((nb_chan, i_stop - i_start), dtype='int16')
         for i, channel_idx in enumerate(channel_indexes):
-            channel_name = stream_channels['name'][channel_idx]
+            channel_name = stream_channel_names[channel_idx]
 
             # use previously loaded channel data if possible
             if channel_name in self._analogsignal_cache:
@@ -348,44 +458,58 @@ class Plexon2RawIO(BaseRawIO):
                 fragment_timestamps, fragment_counts, values = res
                 self._analogsignal_cache[channel_name] = values
 
-            raw_signals[:, i] = values[i_start: i_stop]
+            raw_signals[i, :] = values[i_start: i_stop]
 
-        return raw_signals
+        # use dimensions (time, channel), the transposed view is in fortran (column major) order
+        return raw_signals.T
 
     def clear_analogsignal_cache(self):
         for channel_name, values in self._analogsignal_cache.items():
             del values
         self._analogsignal_cache = {}
 
-    def _spike_count(self, block_index, seg_index, spike_channel_index):
-        channel_header = self.header['spike_channels'][spike_channel_index]
-        channel_name, channel_unit_id = channel_header['name'].split('.')
-        channel_unit_id = int(channel_unit_id)
-
+    def _get_spike_channel_data(self, channel_name):
         # loading spike channel data on demand when not already cached
         if channel_name not in self._spike_channel_cache:
-            self._spike_channel_cache[channel_name] = self.pl2reader.pl2_get_spike_channel_data_by_name(channel_name)
+            res = self.pl2reader.pl2_get_spike_channel_data_by_name(channel_name)
+            spike_timestamps, unit_ids, waveforms = res
 
-        spike_timestamps, unit_ids, waveforms = self._spike_channel_cache[channel_name]
-        nb_spikes = np.count_nonzero(unit_ids == channel_unit_id)
+            # group spike indices by unit once, such that the spikes of a unit can be selected by
+            # index lookup instead of comparing all unit ids of the channel on every request
+            order = np.argsort(unit_ids, kind='stable')
+            units, unit_starts = np.unique(unit_ids[order], return_index=True)
+            unit_spike_indices = dict(zip(units.tolist(), np.split(order, unit_starts[1:])))
 
-        return nb_spikes
+            self._spike_channel_cache[channel_name] = spike_timestamps, unit_spike_indices, waveforms
 
-    def _get_spike_timestamps(self, block_index, seg_index, spike_channel_index, t_start, t_stop):
+        return self._spike_channel_cache[channel_name]
+
+    def _get_unit_spike_indices(self, spike_channel_index, t_start, t_stop):
+        # returns the spike channel data and the (sorted) indices of the spikes of the neo
+        # spike channel within the given time limits
         channel_header = self.header['spike_channels'][spike_channel_index]
         channel_name, channel_unit_id = channel_header['name'].split('.')
-        channel_unit_id = int(channel_unit_id)
 
-        # loading spike channel data on demand when not already cached
-        if channel_name not in self._spike_channel_cache:
-            self._spike_channel_cache[channel_name] = self.pl2reader.pl2_get_spike_channel_data_by_name(channel_name)
+        spike_timestamps, unit_spike_indices, waveforms = self._get_spike_channel_data(channel_name)
+        spike_indices = unit_spike_indices.get(int(channel_unit_id), np.array([], dtype='intp'))
+
+        if t_start is not None or t_stop is not None:
+            time_slice = self._get_timestamp_time_slice(t_start, t_stop, spike_timestamps)
+            i_start = 0 if time_slice.start is None else time_slice.start
+            i_stop = len(spike_timestamps) if time_slice.stop is None else time_slice.stop
+            spike_indices = spike_indices[np.searchsorted(spike_indices, i_start):
+                                          np.searchsorted(spike_indices, i_stop)]
 
-        spike_timestamps, unit_ids, waveforms = self._spike_channel_cache[channel_name]
+        return spike_timestamps, spike_indices, waveforms
 
-        time_mask = self._get_timestamp_time_mask(t_start, t_stop, spike_timestamps)
+    def _spike_count(self, block_index, seg_index, spike_channel_index):
+        _, spike_indices, _ = self._get_unit_spike_indices(spike_channel_index, None, None)
+        return len(spike_indices)
 
-        unit_mask = unit_ids[time_mask] == channel_unit_id
-        spike_timestamps = spike_timestamps[time_mask][unit_mask]
+    def _get_spike_timestamps(self, block_index, seg_index, spike_channel_index, t_start, t_stop):
+        spike_timestamps, spike_indices, _ = self._get_unit_spike_indices(spike_channel_index,
+                                                                          t_start, t_stop)
+        spike_timestamps = spike_timestamps[spike_indices]
 
         # spike timestamps are counted from the session start recording time
         spike_timestamps += self.pl2reader.pl2_file_info.m_StartRecordingTime
@@ -395,8 +519,9 @@ class Plexon2RawIO(BaseRawIO):
     def _rescale_spike_timestamp(self, spike_timestamps, dtype):
         # must rescale to second a particular spike_timestamps
         # with a fixed dtype so the user can choose the precision they want
-        spike_times = spike_timestamps.astype(dtype)
-        spike_times /= self.pl2reader.pl2_file_info.m_TimestampFrequency
+        # casting and scaling is done in a single pass over the data
+        spike_times = np.divide(spike_timestamps, self.pl2reader.pl2_file_info.m_TimestampFrequency,
+                                dtype=dtype)
         return spike_times
 
     def _get_spike_raw_waveforms(self, block_index, seg_index, spike_channel_index,
@@ -406,55 +531,52 @@ class Plexon2RawIO(BaseRawIO):
         # this must be as fast as possible.
         # the same clip t_start/t_start must be used in _spike_timestamps()
 
-        channel_header = self.header['spike_channels'][spike_channel_index]
-        channel_name, channel_unit_id = channel_header['name'].split('.')
-
-        # loading spike channel data on demand when not already cached
-        if channel_name not in self._spike_channel_cache:
-            self._spike_channel_cache[channel_name] = self.pl2reader.pl2_get_spike_channel_data_by_name(channel_name)
-
-        spike_timestamps, unit_ids, waveforms = self._spike_channel_cache[channel_name]
-
-        time_mask = self._get_timestamp_time_mask(t_start, t_stop, spike_timestamps)
-
-        unit_mask = unit_ids[time_mask] == int(channel_unit_id)
-        waveforms = waveforms[time_mask][unit_mask]
+        _, spike_indices, waveforms = self._get_unit_spike_indices(spike_channel_index,
+                                                                   t_start, t_stop)
+        waveforms = waveforms[spike_indices]
 
         # add tetrode dimension
         waveforms = np.expand_dims(waveforms, axis=1)
         return waveforms
 
-    def _get_timestamp_time_mask(self, t_start, t_stop, timestamps):
-
-        if t_start is not None or t_stop is not None:
-            # restrict spikes to given limits (in seconds)
-            timestamp_frequency = self.pl2reader.pl2_file_info.m_TimestampFrequency
-            lim0 = int(t_start * timestamp_frequency)
-            lim1 = int(t_stop * self.pl2reader.pl2_file_info.m_TimestampFrequency)
-
-            # limits are with respect to segment t_start and not to time 0
-            lim0 -= self.pl2reader.pl2_file_info.m_StartRecordingTime
-            lim1 -= self.pl2reader.pl2_file_info.m_StartRecordingTime
-
-            time_mask = (timestamps >= lim0) & (timestamps <= lim1)
+    def _get_timestamp_time_slice(self, t_start, t_stop, timestamps):
+        # timestamps are sorted, so the limits (in seconds, inclusive) can be found by
+        # binary search instead of comparing every timestamp
+        timestamp_frequency = self.pl2reader.pl2_file_info.m_TimestampFrequency
+        start_recording_time = self.pl2reader.pl2_file_info.m_StartRecordingTime
 
-        else:
-            time_mask = slice(None, None)
+        # limits are with respect to segment t_start and not to time 0
+        i_start, i_stop = None, None
+        if t_start is not None:
+            lim0 = int(t_start * timestamp_frequency) - start_recording_time
+            i_start = np.searchsorted(timestamps, lim0, side='left')
+        if t_stop is not None:
+            lim1 = int(t_stop * timestamp_frequency) - start_recording_time
+            i_stop = np.searchsorted(timestamps, lim1, side='right')
 
-        return time_mask
+        return slice(i_start, i_stop)
 
     def _event_count(self, block_index, seg_index, event_channel_index):
 
         channel_header = self.header['event_channels'][event_channel_index]
         channel_name = channel_header['name']
 
+        # event data is only loaded when timestamps are requested, the count is part of the
+        # channel info
+        return self._digital_channel_infos[channel_name].m_NumberOfEvents
+
+    def _get_event_channel_data(self, channel_name):
         # loading event channel data on demand when not already cached
         if channel_name not in self._event_channel_cache:
-            self._event_channel_cache[channel_name] = self.pl2reader.pl2_get_digital_channel_data_by_name(channel_name)
+            event_times, values = self.pl2reader.pl2_get_digital_channel_data_by_name(channel_name)
+
+            # convert event values to labels only once, formatting each distinct value a single time
+            unique_values, value_indices = np.unique(values, return_inverse=True)
+            labels = unique_values.astype('U')[value_indices]
 
-        event_times, values = self._event_channel_cache[channel_name]
+            self._event_channel_cache[channel_name] = event_times, labels
 
-        return len(event_times)
+        return self._event_channel_cache[channel_name]
 
     def _get_event_timestamps(self, block_index, seg_index, event_channel_index, t_start, t_stop):
         # the main difference between spike channel and event channel
@@ -465,35 +587,31 @@ class Plexon2RawIO(BaseRawIO):
         channel_header = self.header['event_channels'][event_channel_index]
         channel_name = channel_header['name']
 
-        # loading event channel data on demand when not already cached
-        if channel_name not in self._event_channel_cache:
-            self._event_channel_cache[channel_name] = self.pl2reader.pl2_get_digital_channel_data_by_name(channel_name)
-
-        event_times, labels = self._event_channel_cache[channel_name]
-        labels = np.asarray(labels, dtype='U')
+        event_times, labels = self._get_event_channel_data(channel_name)
 
-        time_mask = self._get_timestamp_time_mask(t_start, t_stop, event_times)
+        time_slice = self._get_timestamp_time_slice(t_start, t_stop, event_times)
 
         # events don't have a duration. Epochs are not supported
         durations = None
 
         # event timestamps are counted from the session start recording time
-        return_times = event_times[time_mask] + self.pl2reader.pl2_file_info.m_StartRecordingTime
+        return_times = event_times[time_slice] + self.pl2reader.pl2_file_info.m_StartRecordingTime
 
-        return return_times, durations, labels[time_mask]
+        return return_times, durations, labels[time_slice]
 
     def _rescale_event_timestamp(self, event_timestamps, dtype, event_channel_index):
         # must rescale to second a particular event_timestamps
         # with a fixed dtype so the user can choose the precision he want.
 
-        event_times = event_timestamps.astype(dtype)
-        event_times /= self.pl2reader.pl2_file_info.m_TimestampFrequency
+        event_times = np.divide(event_timestamps, self.pl2reader.pl2_file_info.m_TimestampFrequency,
+                                dtype=dtype)
         return event_times
 
     def _rescale_epoch_duration(self, raw_duration, dtype, event_channel_index):
-        durations = raw_duration.astype(dtype)
-        durations /= self.pl2reader.pl2_file_info.m_TimestampFrequency
+        durations = np.divide(raw_duration, self.pl2reader.pl2_file_info.m_TimestampFrequency,
+                              dtype=dtype)
         return durations
 
     def close(self):
-        self.pl2reader.pl2_close_all_files()
+        # only close the file of this reader, other readers might share the same dll
+        self.pl2reader.pl2_close_file()
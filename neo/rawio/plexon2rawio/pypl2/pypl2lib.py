@@ -179,11 +179,14 @@ class PyPL2FileReader:
             }
         ]
 
-        self.pl2_dll.PL2_OpenFile(
+        result = self.pl2_dll.PL2_OpenFile(
             pl2_file.encode('ascii'),
             ctypes.byref(self._file_handle),
         )
 
+        if not result:
+            raise IOError(f"Error: Can't open PL2 file {pl2_file}: {self.pl2_get_last_error()}")
+
         # load file info
         self.pl2_get_file_info()
         # check if spiking data can be loaded using zugbruecke
@@ -198,9 +201,9 @@ class PyPL2FileReader:
         """
 
         self.pl2_dll.PL2_CloseFile.argtypes = (
-            ctypes.POINTER(ctypes.c_int),
+            ctypes.c_int,
         )
-        self.pl2_dll.PL2_CloseFile(ctypes.c_int(1))
+        self.pl2_dll.PL2_CloseFile(self._file_handle)
 
     def pl2_close_all_files(self):
         """